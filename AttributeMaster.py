@@ -42,6 +42,41 @@ type_double = 3
 type_boolean = 4
 type_enum = 5
 
+# Maps the numeric and unit types of the API to the names returned by
+# cmds.attributeQuery(attributeType=True)
+numeric_type_names = {
+    OpenMaya.MFnNumericData.kBoolean: "bool",
+    OpenMaya.MFnNumericData.kByte: "byte",
+    OpenMaya.MFnNumericData.kChar: "char",
+    OpenMaya.MFnNumericData.kShort: "short",
+    OpenMaya.MFnNumericData.kInt: "long",
+    OpenMaya.MFnNumericData.kFloat: "float",
+    OpenMaya.MFnNumericData.kDouble: "double",
+    OpenMaya.MFnNumericData.k2Short: "short2",
+    OpenMaya.MFnNumericData.k2Int: "long2",
+    OpenMaya.MFnNumericData.k2Float: "float2",
+    OpenMaya.MFnNumericData.k2Double: "double2",
+    OpenMaya.MFnNumericData.k3Short: "short3",
+    OpenMaya.MFnNumericData.k3Int: "long3",
+    OpenMaya.MFnNumericData.k3Float: "float3",
+    OpenMaya.MFnNumericData.k3Double: "double3",
+    OpenMaya.MFnNumericData.k4Double: "double4",
+}
+
+unit_type_names = {
+    OpenMaya.MFnUnitAttribute.kDistance: "doubleLinear",
+    OpenMaya.MFnUnitAttribute.kAngle: "doubleAngle",
+    OpenMaya.MFnUnitAttribute.kTime: "time",
+}
+
+# Colors of the attribute names in the list for each of the attribute states, keyable
+# attributes have no color
+_COLOR_SEPARATOR = QtGui.QColor(49, 167, 214)
+_COLOR_HIDDEN = QtGui.QColor(51, 51, 51)
+_COLOR_LOCKED = QtGui.QColor(89, 104, 117)
+_COLOR_UNKEYABLE = QtGui.QColor(148, 148, 148)
+_COLOR_KEYABLE = None
+
 
 def get_type_index(name):
     if name == "vector":
@@ -86,6 +121,106 @@ def createSpacerItem(width=20, height=40):
         width, height, QtWidgets.QSizePolicy.Expanding, QtWidgets.QSizePolicy.Minimum)
 
 
+def get_depend_node(name):
+    """
+    Returns the MObject of the node with the given name.
+    """
+    selection = OpenMaya.MSelectionList()
+    selection.add(name)
+    return selection.getDependNode(0)
+
+
+def get_node_name(node):
+    """
+    Returns the name of a node MObject. Dag nodes use their shortest unique path to match the
+    names returned by cmds.ls.
+    """
+    if node.hasFn(OpenMaya.MFn.kDagNode):
+        return OpenMaya.MDagPath.getAPathTo(node).partialPathName()
+    return OpenMaya.MFnDependencyNode(node).name()
+
+
+def get_attribute_type(attribute):
+    """
+    Returns the type name of an attribute MObject, matching the names that are returned
+    by cmds.attributeQuery(attributeType=True).
+    """
+    if attribute.hasFn(OpenMaya.MFn.kEnumAttribute):
+        return "enum"
+    if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+        numeric_type = OpenMaya.MFnNumericAttribute(attribute).numericType()
+        return numeric_type_names.get(numeric_type, "double")
+    if attribute.hasFn(OpenMaya.MFn.kUnitAttribute):
+        unit_type = OpenMaya.MFnUnitAttribute(attribute).unitType()
+        return unit_type_names.get(unit_type, "double")
+    if attribute.hasFn(OpenMaya.MFn.kTypedAttribute):
+        return "typed"
+    if attribute.hasFn(OpenMaya.MFn.kMessageAttribute):
+        return "message"
+    if attribute.hasFn(OpenMaya.MFn.kMatrixAttribute):
+        return "matrix"
+    if attribute.hasFn(OpenMaya.MFn.kCompoundAttribute):
+        return "compound"
+    return "double"
+
+
+def as_list(value):
+    """
+    Wraps single values in a list to match the results of cmds.attributeQuery.
+    """
+    return list(value) if isinstance(value, (list, tuple)) else [value]
+
+
+def get_user_attributes(node, mobject=None):
+    """
+    Collects the data of all user defined attributes on a node in a single pass of the API
+    rather than querying each attribute with multiple commands. The order of the attributes
+    matches the order returned by cmds.listAttr(userDefined=True).
+
+    node    str
+        the name of the node to collect the attributes of.
+
+    mobject    MObject
+        the node to collect the attributes of. If not given it is looked up from the name.
+
+    :return: dict[] of keyword arguments for an Attribute
+    """
+    if mobject is None:
+        mobject = get_depend_node(node)
+    fn_node = OpenMaya.MFnDependencyNode(mobject)
+    attributes = []
+    for index in range(fn_node.attributeCount()):
+        attribute = fn_node.attribute(index)
+        if fn_node.attributeClass(attribute) != OpenMaya.MFnDependencyNode.kLocalDynamicAttr:
+            continue
+
+        fn_attr = OpenMaya.MFnAttribute(attribute)
+        data = {
+            # The API has no query for nice names so this one is still done through cmds
+            "niceName": cmds.attributeQuery(fn_attr.name, node=node, niceName=True),
+            "longName": fn_attr.name,
+            "keyable": fn_attr.keyable,
+            "channelBox": fn_attr.channelBox,
+            "type": get_attribute_type(attribute),
+            "hasMin": False,
+            "hasMax": False,
+            "minimum": None,
+            "maximum": None,
+        }
+
+        if attribute.hasFn(OpenMaya.MFn.kNumericAttribute):
+            fn_numeric = OpenMaya.MFnNumericAttribute(attribute)
+            data["hasMin"] = fn_numeric.hasMin()
+            data["hasMax"] = fn_numeric.hasMax()
+            if data["hasMin"]:
+                data["minimum"] = as_list(fn_numeric.getMin())
+            if data["hasMax"]:
+                data["maximum"] = as_list(fn_numeric.getMax())
+
+        attributes.append(data)
+    return attributes
+
+
 class UndoStateContext(object):
     """
     The undo state is used to force undo commands to be registered when this
@@ -128,100 +263,130 @@ class UndoChunkContext(object):
         cmds.undoInfo(closeChunk=True)
 
 
-class Attribute(QtWidgets.QWidget):
+class SuspendRefreshContext(object):
     """
-    Stores the values of an attribute as an object for easy sorting and managing.
+    Stops the tool from refreshing on selection changes while a chain of commands is run.
+    Can be used in combination with the "with" statement.
+
+    with SuspendRefreshContext(ui):
+        # code
     """
 
-    def __init__(self, ui, node, niceName, longName, locked=False, keyable=True, channelBox=False, type="double"):
-        super(Attribute, self).__init__()
+    def __init__(self, ui):
         self.ui = ui
 
-        self.main_layout = QtWidgets.QHBoxLayout()
-        self.main_layout.setMargin(3)
-        self.setLayout(self.main_layout)
+    def __enter__(self):
+        self.ui.suspend_refresh()
+
+    def __exit__(self, *exc_info):
+        self.ui.resume_refresh()
+
+
+class Attribute(object):
+    """
+    Stores the values of an attribute as an object for easy sorting and managing.
+    """
 
+    def __init__(self, node, niceName, longName, locked=False, keyable=True, channelBox=False, type="double",
+                 hasMin=False, hasMax=False, minimum=None, maximum=None, node_handle=None):
         self.node = node
         self.niceName = niceName
         self.longName = longName
+        self._path = "{}.{}".format(node, longName)
         self.locked = locked
         self.keyable = keyable
         self.channelBox = channelBox
         self.type = type
 
+        # Range meta, collected up front alongside the rest of the attribute data
+        self._hasMin = hasMin
+        self._hasMax = hasMax
+        self._min = minimum
+        self._max = maximum
+
         # Display State meta
         self.displayState = AttributeMaster.DISPLAY_LONGNAME
 
-        if type == "enum":
-            cmds.attributeQuery(longName, node=node, listEnum=True)
+        # The state of the attribute is read through the API from the node rather than with
+        # commands. The handle is shared by all attributes of the node
+        if node_handle is None:
+            node_handle = OpenMaya.MObjectHandle(get_depend_node(node))
+        self._node_handle = node_handle
+
+        # Cached (exists, keyable, locked, channelBox) state, see _fetch_state
+        self._state = None
+
+        # Color of the name shown in the list, see refresh
+        self.background = None
 
-        self.create_ui()
         self.refresh()
 
+    def _fetch_state(self):
+        """
+        Queries the state of the attribute in Maya and caches it so the display and selection
+        handling don't query the same values over and over. The cache is kept until
+        invalidate_state is called.
+
+        :return: (exists, keyable, locked, channelBox)
+        """
+        if self._state is None:
+            fn_node = None
+            if self._node_handle.isValid():
+                fn_node = OpenMaya.MFnDependencyNode(self._node_handle.object())
+
+            if fn_node is not None and fn_node.hasAttribute(self.longName):
+                # The plug is looked up by name as the attribute may have been renamed, or
+                # deleted and restored by an undo
+                plug = fn_node.findPlug(self.longName, False)
+                self._state = (True, plug.isKeyable, plug.isLocked, plug.isChannelBox)
+            else:
+                self._state = (False, False, False, False)
+        return self._state
+
+    def invalidate_state(self):
+        """
+        Clears the cached state so it is queried again the next time it is needed. This should
+        be called whenever the state of the attribute is changed.
+        """
+        self._state = None
+
     def exists(self):
-        return cmds.attributeQuery(self.longName, node=self.node, exists=True)
+        return self._fetch_state()[0]
 
     def is_keyable(self):
-        return self.exists() and cmds.getAttr(self.path, keyable=True)
+        exists, keyable, _, _ = self._fetch_state()
+        return exists and keyable
 
     def is_locked(self):
-        return self.exists() and cmds.getAttr(self.path, lock=True)
+        exists, _, locked, _ = self._fetch_state()
+        return exists and locked
 
     def is_hidden(self):
-        return self.exists() and cmds.getAttr(self.path, channelBox=True) is False
+        exists, _, _, channelBox = self._fetch_state()
+        return exists and channelBox is False
 
     def is_seperator(self):
         return self.longName is not None and "__seperator_" in self.longName
 
     @property
     def path(self):
-        return "{}.{}".format(self.node, self.longName)
+        return self._path
 
     @property
     def hasMin(self):
-        return self.exists() and cmds.attributeQuery(self.longName, node=self.node, minExists=True) \
-            and (self.type == "integer" or self.type == "double")
+        return self._hasMin and (self.type == "integer" or self.type == "double")
 
     @property
     def hasMax(self):
-        return self.exists() and cmds.attributeQuery(self.longName, node=self.node, maxExists=True) \
-            and (self.type == "integer" or self.type == "double")
+        return self._hasMax and (self.type == "integer" or self.type == "double")
 
     @property
     def max(self):
-        return cmds.attributeQuery(self.longName, node=self.node, max=True)
+        return self._max
 
     @property
     def min(self):
-        return cmds.attributeQuery(self.longName, node=self.node, min=True)
-
-    def create_ui(self):
-        """
-        Creates all of the UI elements for the attribute to be displayed in the editor and
-        makes any connections for buttons.
-        """
-        self.label = QtWidgets.QLabel(self.niceName, objectName="ShortName")
-        self.labelLong = QtWidgets.QLabel(self.longName, objectName="LongName")
-        self.deleteBtn = QtWidgets.QPushButton(
-            icon=QtGui.QIcon(":/deleteActive.png"), objectName="DeleteBtn")
-        self.deleteBtn.setSizePolicy(
-            QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Minimum)
-        self.deleteBtn.setToolTip("Delete attribute")
-        self.deleteBtn.setToolTipDuration(5000)
-
-        self.valueWidget = None
-
-        self.editor = None
-
-        self.deleteBtn.clicked.connect(self.__delete)
-
-        self.main_layout.addWidget(self.label)
-        self.main_layout.addWidget(self.labelLong)
-        self.main_layout.addWidget(self.deleteBtn)
-
-    def __delete(self):
-        self.delete()
-        self.ui.refresh()
+        return self._min
 
     def delete(self):
         """
@@ -252,27 +417,30 @@ class Attribute(QtWidgets.QWidget):
 
             # Actually delete the attribute
             cmds.deleteAttr(self.path)
+        self.invalidate_state()
 
     def refresh(self):
         """
         Refreshes the display of this attribute. This should be called if the attribute's state
         has been changed at all.
+
+        :return: bool True if the display of the attribute has changed
         """
-        style = "QWidget { padding: 5px 20px; } \
-            #ShortName { background: %; border-radius: 3px } \
-            #LongName { color: rgba(255, 255, 255, 0.5) } \
-            #DeleteBtn { padding: 0; background: transparent; border: 0; }"
+        self.invalidate_state()
         if self.is_seperator():
-            style = style.replace("%", "rgb(49, 167, 214)")
+            background = _COLOR_SEPARATOR
         elif self.is_hidden() and self.is_keyable() is False:
-            style = style.replace("%", "rgb(51,51,51)")
+            background = _COLOR_HIDDEN
         elif self.is_locked():
-            style = style.replace("%", "rgb(89,104,117)")
+            background = _COLOR_LOCKED
         elif not self.is_keyable():
-            style = style.replace("%", "rgb(148,148,148)")
-        elif self.is_keyable():
-            style = style.replace("%", "transparent")
-        self.setStyleSheet(style)
+            background = _COLOR_UNKEYABLE
+        else:
+            background = _COLOR_KEYABLE
+
+        changed = background is not self.background
+        self.background = background
+        return changed
 
     def rename(self, niceName=None, longName=None):
         """
@@ -284,6 +452,10 @@ class Attribute(QtWidgets.QWidget):
         longName    str
             sets the new long name for the attribute.
         """
+        # The state may have been changed outside of the tool since it was cached, renaming
+        # has to work with the current lock state
+        self.invalidate_state()
+
         if niceName is not None:
             if cmds.attributeQuery(niceName, node=self.node, exists=True):
                 return
@@ -302,7 +474,6 @@ class Attribute(QtWidgets.QWidget):
                 cmds.setAttr(self.path, lock=True)
 
             self.niceName = niceName
-            self.label.setText(niceName)
 
         if longName is not None:
             if cmds.attributeQuery(longName, node=self.node, exists=True):
@@ -314,12 +485,213 @@ class Attribute(QtWidgets.QWidget):
 
             cmds.renameAttr(self.path, longName)
             self.longName = longName
-            self.labelLong.setText(longName)
+            self._path = "{}.{}".format(self.node, longName)
 
             if was_locked:
                 cmds.setAttr(self.path, lock=True)
 
 
+class AttributeListModel(QtCore.QAbstractListModel):
+    """
+    Holds the attributes of the selected node in the order they are listed. Rows can be moved
+    by dragging and dropping them inside of the list view.
+    """
+
+    AttributeRole = QtCore.Qt.UserRole
+
+    MIME_TYPE = "application/x-attributemaster-rows"
+
+    def __init__(self, parent=None):
+        super(AttributeListModel, self).__init__(parent)
+        self._attributes = []
+
+    @property
+    def attributes(self):
+        return self._attributes
+
+    def set_attributes(self, attributes):
+        """
+        Replaces all of the attributes in the model with a single reset.
+        """
+        self.beginResetModel()
+        self._attributes = list(attributes)
+        self.endResetModel()
+
+    def refresh_attribute(self, attribute):
+        """
+        Refreshes the state of the attribute and updates the row displaying it if its display
+        has changed.
+        """
+        if attribute.refresh():
+            self.update_attribute(attribute)
+
+    def update_attribute(self, attribute):
+        """
+        Updates the row displaying the attribute.
+        """
+        if attribute in self._attributes:
+            index = self.index(self._attributes.index(attribute))
+            self.dataChanged.emit(index, index)
+
+    def rowCount(self, parent=QtCore.QModelIndex()):
+        return 0 if parent.isValid() else len(self._attributes)
+
+    def data(self, index, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        attribute = self._attributes[index.row()]
+        if role == QtCore.Qt.DisplayRole:
+            return attribute.niceName
+        if role == AttributeListModel.AttributeRole:
+            return attribute
+        return None
+
+    def flags(self, index):
+        if not index.isValid():
+            return QtCore.Qt.ItemIsDropEnabled
+        return QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDragEnabled
+
+    def supportedDropActions(self):
+        return QtCore.Qt.MoveAction
+
+    def mimeTypes(self):
+        return [AttributeListModel.MIME_TYPE]
+
+    def mimeData(self, indexes):
+        """
+        Only the rows being dragged are stored, the attributes themselves never leave the model.
+        """
+        rows = sorted(set(index.row() for index in indexes))
+        data = QtCore.QMimeData()
+        data.setData(AttributeListModel.MIME_TYPE,
+                     QtCore.QByteArray(",".join(str(row) for row in rows).encode("utf-8")))
+        return data
+
+    def dropMimeData(self, data, action, row, column, parent):
+        """
+        Inserts the dragged attributes at the drop position. The view removes the original rows
+        once the drop has completed.
+        """
+        if action == QtCore.Qt.IgnoreAction:
+            return True
+        if not data.hasFormat(AttributeListModel.MIME_TYPE):
+            return False
+
+        encoded = bytes(data.data(AttributeListModel.MIME_TYPE)).decode("utf-8")
+        attributes = [self._attributes[int(r)] for r in encoded.split(",") if r]
+        if not attributes:
+            return False
+
+        if row == -1:
+            row = self.rowCount()
+        self.beginInsertRows(QtCore.QModelIndex(), row, row + len(attributes) - 1)
+        self._attributes[row:row] = attributes
+        self.endInsertRows()
+        return True
+
+    def removeRows(self, row, count, parent=QtCore.QModelIndex()):
+        if parent.isValid() or count <= 0:
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._attributes[row:row + count]
+        self.endRemoveRows()
+        return True
+
+
+class AttributeDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Paints the rows of the attribute list. Rows are drawn directly rather than with a widget
+    per attribute, the delete button is just a region of the row which emits deleteClicked.
+
+    A value editor for the "editable attribute values" TODO belongs in createEditor, which is
+    only called for the row that is being edited.
+    """
+
+    deleteClicked = QtCore.Signal(object)
+
+    MARGIN = 3
+    PADDING = 20
+
+    SELECTED_COLOR = QtGui.QColor(24, 219, 148, 128)
+    LONGNAME_COLOR = QtGui.QColor(255, 255, 255, 128)
+
+    def sizeHint(self, option, index):
+        height = option.fontMetrics.height() + 10 + AttributeDelegate.MARGIN * 2
+        return QtCore.QSize(option.rect.width(), height)
+
+    def delete_rect(self, rect):
+        """
+        Returns the region of the delete button for a row.
+        """
+        size = rect.height() - AttributeDelegate.MARGIN * 2
+        return QtCore.QRect(rect.right() - AttributeDelegate.MARGIN - size,
+                            rect.top() + AttributeDelegate.MARGIN, size, size)
+
+    def paint(self, painter, option, index):
+        attribute = index.data(AttributeListModel.AttributeRole)
+        if attribute is None:
+            return
+
+        margin = AttributeDelegate.MARGIN
+        padding = AttributeDelegate.PADDING
+
+        painter.save()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.setPen(QtCore.Qt.NoPen)
+
+        rect = option.rect.adjusted(1, 1, -1, -1)
+        if option.state & QtWidgets.QStyle.State_Selected:
+            painter.setBrush(AttributeDelegate.SELECTED_COLOR)
+            painter.drawRoundedRect(rect, 5, 5)
+
+        delete_rect = self.delete_rect(option.rect)
+        content = rect.adjusted(margin, margin, -(delete_rect.width() + margin * 2), -margin)
+        half = content.width() // 2
+        name_rect = QtCore.QRect(content.left(), content.top(), half, content.height())
+        long_rect = QtCore.QRect(name_rect.right() + margin, content.top(),
+                                 content.width() - half - margin, content.height())
+
+        if attribute.background is not None:
+            painter.setBrush(attribute.background)
+            painter.drawRoundedRect(name_rect, 3, 3)
+
+        metrics = option.fontMetrics
+        align = QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter
+
+        text_rect = name_rect.adjusted(padding, 0, -padding, 0)
+        painter.setPen(option.palette.color(QtGui.QPalette.Text))
+        painter.drawText(text_rect, align, metrics.elidedText(
+            attribute.niceName, QtCore.Qt.ElideRight, text_rect.width()))
+
+        text_rect = long_rect.adjusted(padding, 0, -padding, 0)
+        painter.setPen(AttributeDelegate.LONGNAME_COLOR)
+        painter.drawText(text_rect, align, metrics.elidedText(
+            attribute.longName, QtCore.Qt.ElideRight, text_rect.width()))
+
+        AttributeMaster.load_icons()
+        AttributeMaster._ICON_DELETE.paint(painter, delete_rect)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """
+        Handles clicks on the delete button of a row. Presses on the button are consumed so
+        they don't change the selection of the list.
+        """
+        if event.type() in (QtCore.QEvent.MouseButtonPress, QtCore.QEvent.MouseButtonRelease) \
+                and event.button() == QtCore.Qt.LeftButton \
+                and self.delete_rect(option.rect).contains(event.pos()):
+            if event.type() == QtCore.QEvent.MouseButtonRelease:
+                self.deleteClicked.emit(index.data(AttributeListModel.AttributeRole))
+            return True
+        return super(AttributeDelegate, self).editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        if event.type() == QtCore.QEvent.ToolTip and self.delete_rect(option.rect).contains(event.pos()):
+            QtWidgets.QToolTip.showText(event.globalPos(), "Delete attribute", view, QtCore.QRect(), 5000)
+            return True
+        return super(AttributeDelegate, self).helpEvent(event, view, option, index)
+
+
 class AttributeEditor(QDialog):
 
     def __init__(self, parent):
@@ -363,6 +735,22 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
     DISPLAY_LONGNAME = 0
     DISPLAY_VALUE = 1
 
+    # Icons shared by every widget of the tool, see load_icons
+    _ICON_DELETE = None
+    _ICON_ADD = None
+    _ICON_REFRESH = None
+
+    @classmethod
+    def load_icons(cls):
+        """
+        Loads the icons used by the tool the first time they are needed so the same icons are
+        reused by every attribute instead of being loaded from the resources for each one.
+        """
+        if cls._ICON_DELETE is None:
+            cls._ICON_DELETE = QtGui.QIcon(":/deleteActive.png")
+            cls._ICON_ADD = QtGui.QIcon(":/addClip.png")
+            cls._ICON_REFRESH = QtGui.QIcon(":/refresh.png")
+
     def __init__(self, parent=maya_main_window(), name=TOOL_NAME):
         deleteMayaWindowContext(name)
         super(AttributeMaster, self).__init__(parent)
@@ -376,7 +764,46 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         # This is a simple attribute to stop the closeEvent from being called
         self.window_is_open = False
 
+        # Selection changes are coalesced into a single refresh so rapid changes to the
+        # selection don't rebuild the list for every event
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(50)
+        self._refresh_timer.timeout.connect(self.refresh)
+
+        # Set when the selection changes while the tool is hidden, the refresh is then
+        # deferred until the tool is shown again
+        self._dirty = False
+
+        # Number of active SuspendRefreshContexts, selection changes are held back while this
+        # is above zero and a single refresh is run once they have all exited
+        self._suspend_refresh = 0
+        self._refresh_suppressed = False
+
+        self.callback = None
+
+        # Handle of the first selected node, updated by the selection callback. For dag nodes
+        # the selected path is kept as well so instances are named as they were selected
+        self._current_node = None
+        self._current_path = None
+
+        # Renames are committed a short time after the last edit so a burst of edits results
+        # in a single rename, see name_change. Keyed by (attribute, name type)
+        self._pending_renames = {}
+        self._rename_timer = QtCore.QTimer(self)
+        self._rename_timer.setSingleShot(True)
+        self._rename_timer.setInterval(250)
+        self._rename_timer.timeout.connect(self.commit_name_changes)
+
+        # Rows can be removed several times for a single drop, the node is reordered once
+        # after the drop has completed
+        self._reorder_timer = QtCore.QTimer(self)
+        self._reorder_timer.setSingleShot(True)
+        self._reorder_timer.setInterval(0)
+        self._reorder_timer.timeout.connect(self.reorder)
+
     def run(self):
+        self.update_current_node()
         self.create_ui()
         self.refresh()
         self.register_callback()
@@ -392,6 +819,8 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         """
         Creates all of the base UI elements for the attribute editor.
         """
+        AttributeMaster.load_icons()
+
         layout = QtWidgets.QVBoxLayout()
         self.setLayout(layout)
 
@@ -406,39 +835,45 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         title.addSpacerItem(spacer)
 
         addSeperatorBtn = QtWidgets.QPushButton(
-            "Seperator", icon=QtGui.QIcon(":/addClip.png"))
+            "Seperator", icon=AttributeMaster._ICON_ADD)
         addSeperatorBtn.clicked.connect(self.add_new_seperator)
         title.addWidget(addSeperatorBtn)
 
         addAttrBtn = QtWidgets.QPushButton(
-            "Attribute", icon=QtGui.QIcon(":/addClip.png"))
+            "Attribute", icon=AttributeMaster._ICON_ADD)
         addAttrBtn.clicked.connect(self.add_attribute)
         title.addWidget(addAttrBtn)
 
-        reloadBtn = QtWidgets.QPushButton(icon=QtGui.QIcon(":/refresh.png"))
+        reloadBtn = QtWidgets.QPushButton(icon=AttributeMaster._ICON_REFRESH)
         reloadBtn.clicked.connect(self.refresh)
         title.addWidget(reloadBtn)
         layout.addLayout(title)
 
-        # Create the list view widget
-        listWidget = QtWidgets.QListWidget()
-        listWidget.setStyleSheet("\
+        # Create the list view, rows are painted by the delegate
+        self.model = AttributeListModel(self)
+        self.model.rowsRemoved.connect(self._schedule_reorder)
+
+        self.delegate = AttributeDelegate(self)
+        self.delegate.deleteClicked.connect(self.remove_attribute)
+
+        listView = QtWidgets.QListView()
+        listView.setStyleSheet("\
             #AttributeList { background: rgba(40, 40, 40, 0.3); outline: none; border: 0; padding: 10px; border-radius: 10px } \
-            QListWidget::item { border: 0; outline: none; border-radius: 5px; margin: 1px } \
-            QListWidget::item:selected { background: rgba(24, 219, 148, 0.5); border: 0; outline: none; } \
         }")
-        listWidget.setObjectName("AttributeList")
-        listWidget.setVerticalScrollMode(
+        listView.setObjectName("AttributeList")
+        listView.setModel(self.model)
+        listView.setItemDelegate(self.delegate)
+        listView.setVerticalScrollMode(
             QtWidgets.QAbstractItemView.ScrollPerPixel)
-        listWidget.setSelectionMode(
+        listView.setSelectionMode(
             QtWidgets.QAbstractItemView.ExtendedSelection)
-        layout.addWidget(listWidget)
-        listWidget.setDragEnabled(True)
-        listWidget.setDragDropMode(listWidget.InternalMove)
-        listWidget.installEventFilter(self)
-        listWidget.itemSelectionChanged.connect(self.on_selection_change)
+        layout.addWidget(listView)
+        listView.setDragEnabled(True)
+        listView.setDragDropMode(listView.InternalMove)
+        listView.setDefaultDropAction(QtCore.Qt.MoveAction)
+        listView.selectionModel().selectionChanged.connect(self.on_selection_change)
 
-        self.listWidget = listWidget
+        self.listView = listView
 
         # Create attribute info panel
         infoWidget = QtWidgets.QWidget()
@@ -495,8 +930,18 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
 
     @property
     def selected_attribute(self):
-        item = self.listWidget.currentItem()
-        return self.listWidget.itemWidget(item) if item is not None else None
+        index = self.listView.currentIndex()
+        return index.data(AttributeListModel.AttributeRole) if index.isValid() else None
+
+    @property
+    def selected_attributes(self):
+        """
+        Returns all of the attributes that are selected in the list.
+
+        :return: Attribute[]
+        """
+        indexes = self.listView.selectionModel().selectedIndexes()
+        return [index.data(AttributeListModel.AttributeRole) for index in indexes]
 
     @property
     def selected_node(self):
@@ -504,61 +949,72 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         Returns the currently selected node. If the selection has more than one item in it then it will
         awlays return the first selected node. If nothing is selected then None is returned.
         """
-        selection = cmds.ls(sl=True)
-        return selection[0] if len(selection) else None
+        if self._current_node is None or not self._current_node.isValid():
+            return None
+        if self._current_path is not None and self._current_path.isValid():
+            return self._current_path.partialPathName()
+        return get_node_name(self._current_node.object())
 
-    def set_keyable(self):
-        selected = self.listWidget.selectedItems()
-        if selected == None:
+    def update_current_node(self):
+        """
+        Stores the first node of the active selection. This is only done when the selection
+        changes so the selection doesn't need to be listed every time the node is needed.
+        """
+        selection = OpenMaya.MGlobal.getActiveSelectionList()
+        self._current_node = None
+        self._current_path = None
+        if selection.isEmpty():
             return
-        for item in selected:
-            attr = self.listWidget.itemWidget(item)
+
+        node = selection.getDependNode(0)
+        self._current_node = OpenMaya.MObjectHandle(node)
+        if node.hasFn(OpenMaya.MFn.kDagNode):
+            self._current_path = selection.getDagPath(0)
+
+    @QtCore.Slot()
+    def set_keyable(self):
+        for attr in self.selected_attributes:
             cmds.setAttr(attr.path, lock=False)
             cmds.setAttr(attr.path, keyable=True)
-            attr.refresh()
+            self.model.refresh_attribute(attr)
 
+    @QtCore.Slot()
     def set_notkeyable(self):
-        selected = self.listWidget.selectedItems()
-        if selected == None:
-            return
-        for item in selected:
-            attr = self.listWidget.itemWidget(item)
+        for attr in self.selected_attributes:
             cmds.setAttr(attr.path, lock=False)
             cmds.setAttr(attr.path, keyable=False)
             cmds.setAttr(attr.path, channelBox=True)
-            attr.refresh()
+            self.model.refresh_attribute(attr)
 
+    @QtCore.Slot()
     def set_displayable(self):
-        selected = self.listWidget.selectedItems()
-        if selected == None:
-            return
-        for item in selected:
-            attr = self.listWidget.itemWidget(item)
+        for attr in self.selected_attributes:
             cmds.setAttr(attr.path, lock=True)
             cmds.setAttr(attr.path, keyable=False)
             cmds.setAttr(attr.path, channelBox=True)
-            attr.refresh()
+            self.model.refresh_attribute(attr)
 
+    @QtCore.Slot()
     def set_hidden(self):
-        selected = self.listWidget.selectedItems()
-        if selected == None:
-            return
-        for item in selected:
-            attr = self.listWidget.itemWidget(item)
+        for attr in self.selected_attributes:
             cmds.setAttr(attr.path, keyable=False)
             cmds.setAttr(attr.path, lock=True)
             cmds.setAttr(attr.path, channelBox=False)
-            attr.refresh()
+            self.model.refresh_attribute(attr)
 
+    @QtCore.Slot()
     def name_change_long(self):
         self.name_change(type='long')
 
+    @QtCore.Slot()
     def name_change_nice(self):
         self.name_change(type='nice')
 
     def name_change(self, type):
         """
-        Updates the currently selected attributes name.
+        Queues a rename of the currently selected attribute. The rename is committed once no
+        other name changes have been made for the interval of the rename timer, only repeated
+        edits of the same name of the same attribute replace each other.
         """
 
         attr = self.selected_attribute
@@ -566,23 +1022,34 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
             return
 
         if type == 'nice':
-            attr.rename(niceName=self.niceNameInput.text())
+            self._pending_renames[(attr, type)] = self.niceNameInput.text()
         if type == 'long':
-            attr.rename(longName=self.longNameInput.text())
-
-    def eventFilter(self, sender, event):
-        if (event.type() == QtCore.QEvent.ChildRemoved):
-            # Item was moved
-            self.reorder()
-        return False
+            self._pending_renames[(attr, type)] = self.longNameInput.text()
+        self._rename_timer.start()
 
+    @QtCore.Slot()
+    def commit_name_changes(self):
+        """
+        Renames the attributes for all of the queued name changes.
+        """
+        pending = self._pending_renames
+        self._pending_renames = {}
+
+        with SuspendRefreshContext(self):
+            for (attr, type), name in pending.items():
+                if type == 'nice':
+                    attr.rename(niceName=name)
+                if type == 'long':
+                    attr.rename(longName=name)
+                self.model.update_attribute(attr)
+
+    @QtCore.Slot()
     def on_selection_change(self):
         """
         Called when the selection is changed in the attribute list.
         """
-        sel_size = len(self.listWidget.selectedItems())
-        ordered = self.attributes_ordered
-        attr = ordered[self.listWidget.currentRow()] if len(ordered) else None
+        sel_size = len(self.selected_attributes)
+        attr = self.selected_attribute if sel_size else None
         self.dataWidget.setEnabled(attr is not None)
 
         self.longNameInput.setText(
@@ -610,73 +1077,81 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
                 attr.is_hidden() and attr.is_keyable() is False)
         return True
 
-    def refresh(self, event=None, *args, **kwargs):
+    @QtCore.Slot()
+    def refresh(self):
         """
         Refreshes the tool.
         """
-        self.listWidget.clear()
-
-        selection = cmds.ls(sl=True)
-        title = selection[0] if len(selection) else "Nothing Selected"
+        # Queued renames are applied first, they would otherwise be made to attributes that
+        # are no longer listed once the list is rebuilt
+        if self._pending_renames:
+            self._rename_timer.stop()
+            self.commit_name_changes()
+
+        select = self.selected_node
+        title = select if select is not None else "Nothing Selected"
         self.titleLabel.setText("<h2>{}</h2>".format(title))
-        self.dataWidget.setVisible(len(selection))
-        self.dataWidget.setEnabled(self.listWidget.currentRow() > 0)
-
-        self.on_selection_change()
-
-        if len(selection) == 0:
-            return
-
-        select = selection[0]
-        user_attributes = cmds.listAttr(select, userDefined=True)
-
-        if user_attributes is None:
-            return
-
-        for x in user_attributes:
-            niceName = cmds.attributeQuery(x, node=select, nn=True)
-            longName = cmds.attributeQuery(x, node=select, ln=True)
-            keyable = cmds.attributeQuery(x, node=select, k=True)
-            channelBox = cmds.attributeQuery(x, node=select, channelBox=True)
-            hasMax = cmds.attributeQuery(x, node=select, maxExists=True)
-            hasMin = cmds.attributeQuery(x, node=select, minExists=True)
-            type = cmds.attributeQuery(x, node=select, attributeType=True)
+        self.dataWidget.setVisible(select is not None)
 
-            attr = Attribute(self, select, niceName, longName=longName,
-                             keyable=keyable, channelBox=channelBox, type=type)
+        attributes = []
+        if select is not None:
+            handle = self._current_node
+            attributes = [Attribute(select, node_handle=handle, **data)
+                          for data in get_user_attributes(select, handle.object())]
 
-            item = QtWidgets.QListWidgetItem()
-            self.listWidget.insertItem(self.listWidget.count(), item)
-            self.listWidget.setItemWidget(item, attr)
-            item.setSizeHint(attr.sizeHint())
+        # The model is reset once with every attribute so the list is only laid out and
+        # repainted a single time
+        self.model.set_attributes(attributes)
+        self.on_selection_change()
 
     @property
     def attributes_ordered(self):
         """
         Returns a property containing all of the attributes listed in their correct order.
 
-        :return: str[]
+        :return: Attribute[]
         """
-        ordered = []
-        for index in range(self.listWidget.count()):
-            item = self.listWidget.item(index)
-            widget = self.listWidget.itemWidget(item)
-            if widget is not None:
-                ordered.append(widget)
-        return ordered
+        return self.model.attributes
 
+    @QtCore.Slot()
     def reorder(self):
         """
         Reorders all the attributes of the node by dleteting them in the order of the list, and
         then undoing it in a way that adds them in a matching order.
+
+        Attributes are only re-added to the end of the node, so everything before the first
+        attribute that is out of place is already in the right order and is left untouched.
         """
-        with UndoStateContext():
-            for attribute in reversed(self.attributes_ordered):
+        ordered = self.attributes_ordered
+        if not ordered:
+            return
+
+        current = cmds.listAttr(ordered[0].node, userDefined=True) or []
+        start = 0
+        while start < min(len(ordered), len(current)) and ordered[start].longName == current[start]:
+            start += 1
+
+        moved = ordered[start:]
+        if not moved:
+            return
+
+        # Deleting and restoring the attributes can fire the selection callback, any refresh
+        # is held back until the node has been reordered
+        with SuspendRefreshContext(self), UndoStateContext():
+            for attribute in reversed(moved):
                 attribute.delete()
 
-            for _ in range(self.listWidget.count()):
+            for _ in range(len(moved)):
                 cmds.undo()
 
+    @QtCore.Slot(QtCore.QModelIndex, int, int)
+    def _schedule_reorder(self, *args):
+        """
+        Queues a reorder of the node once the rows of the list have been moved.
+        """
+        self._reorder_timer.start()
+
+    @QtCore.Slot()
     def add_new_seperator(self):
         """
         Adds a new seperator attribute. A seperator attribute is simplt there
@@ -687,16 +1162,14 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         if node is None:
             return
 
-        # find the next aviliabe id for a seperator
-        id = 0
-        max = 0
-        while cmds.attributeQuery(("__seperator_" + str(id)), node=node, exists=True):
-            max += 1
-            if max > 10:
-                break
-            id += 1
+        # find the next aviliabe id for a seperator from the ids already used on the node
+        ids = [-1]
+        for attribute in cmds.listAttr(node, userDefined=True) or []:
+            suffix = attribute[len("__seperator_"):]
+            if attribute.startswith("__seperator_") and suffix.isdigit():
+                ids.append(int(suffix))
 
-        name = "__seperator_" + str(id)
+        name = "__seperator_" + str(max(ids) + 1)
 
         text, result = QtWidgets.QInputDialog.getText(
             self, "Add Seperator", "Seperator Name:")
@@ -708,6 +1181,7 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
             cmds.setAttr("{}.{}".format(node, name), lock=True)
             self.refresh()
 
+    @QtCore.Slot()
     def add_attribute(self):
         """
         Otions the attribute creator to add a new attribute to the currently selected node.
@@ -720,8 +1194,13 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         except:
             pass
 
-    def remove_attribute(self):
-        pass
+    @QtCore.Slot(object)
+    def remove_attribute(self, attribute):
+        """
+        Deletes an attribute from the node and refreshes the list.
+        """
+        attribute.delete()
+        self.refresh()
 
     def register_callback(self):
         """
@@ -729,15 +1208,64 @@ class AttributeMaster(MayaQWidgetDockableMixin, QDialog):
         """
         self.callback = OpenMaya.MModelMessage.addCallback(
             OpenMaya.MModelMessage.kActiveListModified,
-            self.refresh
+            self._on_active_list_modified
         )
 
+    def _on_active_list_modified(self, *args):
+        """
+        Called by Maya when the selection changes.
+        """
+        self.update_current_node()
+        self._schedule_refresh()
+
+    def _schedule_refresh(self, *args):
+        """
+        Queues a refresh of the tool. If a refresh is already pending then nothing is done
+        so any number of selection changes within the timer interval results in one refresh.
+        When the tool is not visible the refresh is deferred until it is shown again.
+        """
+        if self._suspend_refresh:
+            self._refresh_suppressed = True
+            return
+        if not self.isVisible():
+            self._dirty = True
+            return
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def suspend_refresh(self):
+        """
+        Holds back refreshes from selection changes until resume_refresh is called.
+        """
+        self._suspend_refresh += 1
+
+    def resume_refresh(self):
+        """
+        Ends a call to suspend_refresh. Once there are no suspends left, a refresh is queued if
+        the selection changed while refreshes were held back.
+        """
+        self._suspend_refresh -= 1
+        if self._suspend_refresh == 0 and self._refresh_suppressed:
+            self._refresh_suppressed = False
+            self._schedule_refresh()
+
     def remove_callback(self):
         """
         Removes the callback if it has been added for handling selection changes in the scene.
         """
         if self.callback is not None:
             OpenMaya.MModelMessage.removeCallback(self.callback)
+        self._refresh_timer.stop()
+
+        # Apply any renames that are still waiting on the timer before the tool goes away
+        self._rename_timer.stop()
+        self.commit_name_changes()
+
+    def showEvent(self, event):
+        super(AttributeMaster, self).showEvent(event)
+        if self._dirty:
+            self._dirty = False
+            self.refresh()
 
     def dockCloseEventTriggered(self):
         # Geto workaround to get the closeEvent being called to unhook callbacks